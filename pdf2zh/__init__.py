@@ -1,8 +1,28 @@
+import importlib
 import logging
-from pdf2zh.high_level import translate, translate_stream
 
 log = logging.getLogger(__name__)
 
 __version__ = "1.9.6"
 __author__ = "Byaidu"
 __all__ = ["translate", "translate_stream"]
+
+# high_level pulls in pymupdf, onnxruntime and every translator SDK,
+# so resolve the public API on first access instead of at import time.
+_LAZY = {
+    "translate": ("pdf2zh.high_level", "translate"),
+    "translate_stream": ("pdf2zh.high_level", "translate_stream"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -3,6 +3,7 @@ import logging
 import re
 import unicodedata
 from enum import Enum
+from functools import lru_cache
 from string import Template
 from typing import Dict
 
@@ -43,6 +44,19 @@ from pdf2zh.translator import (
 
 log = logging.getLogger(__name__)
 
+CID_RE = re.compile(r"\(cid:")
+# latex 字体
+FORMULAR_FONT_RE = re.compile(
+    r"(CM[^R]|MS.M|XY|MT|BL|RM|EU|LA|RS|LINE|LCIRCLE|TeX-|rsfs|txsy|wasy|stmary|.*Mono|.*Code|.*Ital|.*Sym|.*Math)"
+)
+FORMULAR_PLACEHOLDER_RE = re.compile(r"^\{v\d+\}$")
+FORMULAR_MARK_RE = re.compile(r"\{\s*v([\d\s]+)\}", re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
 
 class PDFConverterEx(PDFConverter):
     def __init__(
@@ -147,6 +161,11 @@ class TranslateConverter(PDFConverterEx):
         super().__init__(rsrcmgr)
         self.vfont = vfont
         self.vchar = vchar
+        try:  # 用户自定义的公式正则只编译一次
+            self.vfont_re = _compile_pattern(vfont) if vfont else None
+            self.vchar_re = _compile_pattern(vchar) if vchar else None
+        except re.error as e:
+            raise ValueError(f"Invalid formula regex: {e}") from e
         self.thread = thread
         self.layout = layout
         self.noto_name = noto_name
@@ -165,6 +184,52 @@ class TranslateConverter(PDFConverterEx):
         if not self.translator:
             raise ValueError("Unsupported translation service")
 
+    def translate_paragraphs(self, sstk: list[str]) -> list[str]:
+        # 多线程翻译段落，空白和公式原样返回
+        def skip(s: str):  # 空白和公式不翻译
+            return not s.strip() or FORMULAR_PLACEHOLDER_RE.match(s)
+
+        def log_error(e: BaseException):
+            if log.isEnabledFor(logging.DEBUG):
+                log.exception(e)
+            else:
+                log.exception(e, exc_info=False)
+
+        @retry(wait=wait_fixed(1))
+        def worker(s: str):  # 多线程翻译
+            if skip(s):
+                return s
+            try:
+                new = self.translator.translate(s)
+                return new
+            except BaseException as e:
+                log_error(e)
+                raise e
+
+        @retry(wait=wait_fixed(1))
+        def batch_worker(ss: list[str]):  # 多段合并翻译
+            try:
+                return self.translator.translate_many(ss)
+            except BaseException as e:
+                log_error(e)
+                raise e
+
+        batch_size = self.translator.batch_size
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.thread
+        ) as executor:
+            if batch_size > 1:
+                news = list(sstk)
+                ids = [i for i, s in enumerate(sstk) if not skip(s)]
+                batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+                chunks = [[sstk[i] for i in batch] for batch in batches]
+                for batch, result in zip(batches, executor.map(batch_worker, chunks)):
+                    for i, new in zip(batch, result):
+                        news[i] = new
+            else:
+                news = list(executor.map(worker, sstk))
+        return news
+
     def receive_layout(self, ltpage: LTPage):
         # 段落
         sstk: list[str] = []            # 段落文字栈
@@ -193,21 +258,18 @@ class TranslateConverter(PDFConverterEx):
                 except UnicodeDecodeError:
                     font = ""
             font = font.split("+")[-1]      # 字体名截断
-            if re.match(r"\(cid:", char):
+            if CID_RE.match(char):
                 return True
             # 基于字体名规则的判定
-            if self.vfont:
-                if re.match(self.vfont, font):
+            if self.vfont_re:
+                if self.vfont_re.match(font):
                     return True
             else:
-                if re.match(                                            # latex 字体
-                    r"(CM[^R]|MS.M|XY|MT|BL|RM|EU|LA|RS|LINE|LCIRCLE|TeX-|rsfs|txsy|wasy|stmary|.*Mono|.*Code|.*Ital|.*Sym|.*Math)",
-                    font,
-                ):
+                if FORMULAR_FONT_RE.match(font):                        # latex 字体
                     return True
             # 基于字符集规则的判定
-            if self.vchar:
-                if re.match(self.vchar, char):
+            if self.vchar_re:
+                if self.vchar_re.match(char):
                     return True
             else:
                 if (
@@ -343,23 +405,7 @@ class TranslateConverter(PDFConverterEx):
         # B. 段落翻译
         log.debug("\n==========[SSTACK]==========\n")
 
-        @retry(wait=wait_fixed(1))
-        def worker(s: str):  # 多线程翻译
-            if not s.strip() or re.match(r"^\{v\d+\}$", s):  # 空白和公式不翻译
-                return s
-            try:
-                new = self.translator.translate(s)
-                return new
-            except BaseException as e:
-                if log.isEnabledFor(logging.DEBUG):
-                    log.exception(e)
-                else:
-                    log.exception(e, exc_info=False)
-                raise e
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.thread
-        ) as executor:
-            news = list(executor.map(worker, sstk))
+        news = self.translate_paragraphs(sstk)
 
         ############################################################
         # C. 新文档排版
@@ -405,9 +451,7 @@ class TranslateConverter(PDFConverterEx):
             ops_vals: list[dict] = []
 
             while ptr < len(new):
-                vy_regex = re.match(
-                    r"\{\s*v([\d\s]+)\}", new[ptr:], re.IGNORECASE
-                )  # 匹配 {vn} 公式标记
+                vy_regex = FORMULAR_MARK_RE.match(new, ptr)  # 匹配 {vn} 公式标记
                 mod = 0  # 文字修饰符
                 if vy_regex:  # 加载公式
                     ptr += len(vy_regex.group(0))
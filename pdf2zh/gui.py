@@ -16,6 +16,7 @@ import logging
 
 from pdf2zh import __version__
 from pdf2zh.high_level import translate
+from pdf2zh.pages import parse_pages
 from pdf2zh.doclayout import ModelInstance
 from pdf2zh.config import ConfigManager
 from pdf2zh.translator import (
@@ -276,13 +277,7 @@ def translate_file(
     if page_range != "Others":
         selected_page = page_map[page_range]
     else:
-        selected_page = []
-        for p in page_input.split(","):
-            if "-" in p:
-                start, end = p.split("-")
-                selected_page.extend(range(int(start) - 1, int(end)))
-            else:
-                selected_page.append(int(p) - 1)
+        selected_page = list(parse_pages(page_input))
     lang_from = lang_map[lang_from]
     lang_to = lang_map[lang_to]
 
@@ -57,13 +57,12 @@ noto_list = [
 
 
 def check_files(files: List[str]) -> List[str]:
-    files = [
-        f for f in files if not f.startswith("http://")
-    ]  # exclude online files, http
-    files = [
-        f for f in files if not f.startswith("https://")
-    ]  # exclude online files, https
-    missing_files = [file for file in files if not os.path.exists(file)]
+    missing_files = [
+        f
+        for f in files
+        if not f.startswith(("http://", "https://"))  # exclude online files
+        and not os.path.exists(f)
+    ]
     return missing_files
 
 
@@ -110,6 +109,7 @@ def translate_patch(
     interpreter = PDFPageInterpreterEx(rsrcmgr, device, obj_patch)
     if pages:
         total_pages = len(pages)
+        pages = frozenset(pages)  # 每页都要判断是否需要翻译
     else:
         total_pages = doc_zh.page_count
 
@@ -331,6 +331,7 @@ def translate(
         raise PDFValueError("Some files do not exist.")
 
     result_files = []
+    temp_dir = Path(tempfile.gettempdir()).resolve()
 
     for file in files:
         if type(file) is str and (
@@ -369,12 +370,9 @@ def translate(
         s_raw = doc_raw.read()
         doc_raw.close()
 
-        temp_dir = Path(tempfile.gettempdir())
         file_path = Path(file)
         try:
-            if file_path.exists() and file_path.resolve().is_relative_to(
-                temp_dir.resolve()
-            ):
+            if file_path.exists() and file_path.resolve().is_relative_to(temp_dir):
                 file_path.unlink(missing_ok=True)
                 logger.debug(f"Cleaned temp file: {file_path}")
         except Exception as e:
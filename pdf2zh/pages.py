@@ -0,0 +1,26 @@
+import re
+from functools import lru_cache
+
+PAGE_TOKEN_RE = re.compile(r"^(\d+)\s*-\s*(\d+)$|^(\d+)$")
+PAGE_CSV_RE = re.compile(r"^\d+(,\d+)*$")
+
+
+@lru_cache(maxsize=32)
+def parse_pages(pages: str) -> tuple[int, ...]:
+    """
+    Parse a page range string like "1,3,5-10" into zero-based page numbers.
+    The result is cached and immutable, callers may share it freely.
+    """
+    if PAGE_CSV_RE.match(pages):  # 最常见的 "1,2,3"，无需逐项匹配
+        return tuple(int(p) - 1 for p in pages.split(","))
+    result = []
+    for p in pages.split(","):
+        match = PAGE_TOKEN_RE.match(p.strip())
+        if not match:
+            raise ValueError(f"Invalid page range: {p!r}")
+        start, end, single = match.groups()
+        if single:
+            result.append(int(single) - 1)
+        else:
+            result.extend(range(int(start) - 1, int(end)))
+    return tuple(result)
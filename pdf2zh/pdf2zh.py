@@ -7,23 +7,32 @@ from __future__ import annotations
 
 import argparse
 import logging
+import logging.config
 import sys
 from string import Template
 from typing import List, Optional
 
 from pdf2zh import __version__, log
-from pdf2zh.high_level import translate, download_remote_fonts
-from pdf2zh.doclayout import OnnxModel, ModelInstance
 import os
 
 from pdf2zh.config import ConfigManager
-from babeldoc.translation_config import TranslationConfig as YadtConfig
-from babeldoc.high_level import async_translate as yadt_translate
-from babeldoc.high_level import init as yadt_init
-from babeldoc.main import create_progress_handler
+from pdf2zh.pages import parse_pages
 
 logger = logging.getLogger(__name__)
 
+LOG_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {"default": {"format": logging.BASIC_FORMAT}},
+    "handlers": {"rich": {"class": "rich.logging.RichHandler", "formatter": "default"}},
+    "root": {"level": "INFO", "handlers": ["rich"]},
+    # disable httpx, openai, httpcore, http11 logs
+    "loggers": {
+        name: {"level": "CRITICAL", "propagate": False}
+        for name in ("httpx", "openai", "httpcore", "http11")
+    },
+}
+
 
 def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__, add_help=True)
@@ -206,15 +215,8 @@ def parse_args(args: Optional[List[str]]) -> argparse.Namespace:
     parsed_args = create_parser().parse_args(args=args)
 
     if parsed_args.pages:
-        pages = []
-        for p in parsed_args.pages.split(","):
-            if "-" in p:
-                start, end = p.split("-")
-                pages.extend(range(int(start) - 1, int(end)))
-            else:
-                pages.append(int(p) - 1)
         parsed_args.raw_pages = parsed_args.pages
-        parsed_args.pages = pages
+        parsed_args.pages = list(parse_pages(parsed_args.pages))
 
     return parsed_args
 
@@ -231,32 +233,38 @@ def find_all_files_in_directory(directory_path):
         raise ValueError(f"The provided path '{directory_path}' is not a directory.")
 
     file_paths = []
+    stack = [directory_path]
 
-    # Walk through the directory recursively
-    for root, _, files in os.walk(directory_path):
-        for file in files:
-            # Check if the file is a PDF
-            if file.lower().endswith(".pdf"):
-                # Append the full file path to the list
-                file_paths.append(os.path.join(root, file))
+    # Walk through the directory recursively, in the same order as os.walk
+    while stack:
+        subdirs = []
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Like os.walk, skip directories that cannot be listed
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, do not follow symlinked directories
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                # Check if the file is a PDF
+                elif entry.name[-4:].lower() == ".pdf":
+                    file_paths.append(entry.path)
+        stack.extend(reversed(subdirs))
 
     return file_paths
 
 
 def main(args: Optional[List[str]] = None) -> int:
-    from rich.logging import RichHandler
-
-    logging.basicConfig(level=logging.INFO, handlers=[RichHandler()])
-
-    # disable httpx, openai, httpcore, http11 logs
-    logging.getLogger("httpx").setLevel("CRITICAL")
-    logging.getLogger("httpx").propagate = False
-    logging.getLogger("openai").setLevel("CRITICAL")
-    logging.getLogger("openai").propagate = False
-    logging.getLogger("httpcore").setLevel("CRITICAL")
-    logging.getLogger("httpcore").propagate = False
-    logging.getLogger("http11").setLevel("CRITICAL")
-    logging.getLogger("http11").propagate = False
+    if logging.getLogger().handlers:
+        # like basicConfig, keep the handlers of an already configured root logger
+        logging.config.dictConfig(
+            {"version": 1, "incremental": True, "loggers": LOG_CONFIG["loggers"]}
+        )
+    else:
+        logging.config.dictConfig(LOG_CONFIG)
 
     parsed_args = parse_args(args)
 
@@ -266,6 +274,10 @@ def main(args: Optional[List[str]] = None) -> int:
     if parsed_args.debug:
         log.setLevel(logging.DEBUG)
 
+    # heavy imports are deferred until after argument parsing,
+    # so that --help and --version stay fast
+    from pdf2zh.doclayout import OnnxModel, ModelInstance
+
     if parsed_args.onnx:
         ModelInstance.value = OnnxModel(parsed_args.onnx)
     else:
@@ -319,6 +331,9 @@ def main(args: Optional[List[str]] = None) -> int:
     print(parsed_args)
     if parsed_args.babeldoc:
         return yadt_main(parsed_args)
+
+    from pdf2zh.high_level import translate
+
     if parsed_args.dir:
         untranlate_file = find_all_files_in_directory(parsed_args.files[0])
         parsed_args.files = untranlate_file
@@ -330,10 +345,16 @@ def main(args: Optional[List[str]] = None) -> int:
 
 
 def yadt_main(parsed_args) -> int:
+    from babeldoc.translation_config import TranslationConfig as YadtConfig
+    from babeldoc.high_level import async_translate as yadt_translate
+    from babeldoc.high_level import init as yadt_init
+    from babeldoc.main import create_progress_handler
+    from pdf2zh.high_level import download_remote_fonts
+
     if parsed_args.dir:
         untranlate_file = find_all_files_in_directory(parsed_args.files[0])
     else:
-        untranlate_file = parsed_args.files
+        untranlate_file = [file.strip("\"'") for file in parsed_args.files]
     lang_in = parsed_args.lang_in
     lang_out = parsed_args.lang_out
     ignore_cache = parsed_args.ignore_cache
@@ -424,7 +445,6 @@ def yadt_main(parsed_args) -> int:
     import asyncio
 
     for file in untranlate_file:
-        file = file.strip("\"'")
         yadt_config = YadtConfig(
             input_file=file,
             font=font_path,
@@ -3,8 +3,11 @@ import json
 import logging
 import os
 import re
+import threading
+import time
 import unicodedata
 from copy import copy
+from functools import lru_cache
 from string import Template
 from typing import cast
 import deepl
@@ -25,13 +28,70 @@ from pdf2zh.cache import TranslationCache
 from pdf2zh.config import ConfigManager
 
 
-from tenacity import retry, retry_if_exception_type
+from tenacity import before_sleep_log, retry, retry_if_exception_type
 from tenacity import stop_after_attempt
 from tenacity import wait_exponential
 
 
 logger = logging.getLogger(__name__)
 
+# 配置了 PDF2ZH_QPS 时请求已被主动限速，重试只是兜底；
+# 否则沿用原先更宽松的重试策略来应对 RateLimitError
+_PACED_STOP = stop_after_attempt(5)
+_PACED_WAIT = wait_exponential(multiplier=0.5, max=8)
+_UNPACED_STOP = stop_after_attempt(100)
+_UNPACED_WAIT = wait_exponential(multiplier=1, min=1, max=15)
+
+
+def _openai_stop(retry_state):
+    paced = retry_state.args[0].bucket is not None
+    return (_PACED_STOP if paced else _UNPACED_STOP)(retry_state)
+
+
+def _openai_wait(retry_state):
+    paced = retry_state.args[0].bucket is not None
+    return (_PACED_WAIT if paced else _UNPACED_WAIT)(retry_state)
+
+
+OPENAI_RETRY = retry(
+    retry=retry_if_exception_type(openai.RateLimitError),
+    stop=_openai_stop,
+    wait=_openai_wait,
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+)
+
+BATCH_MARK_RE = re.compile(r"^\[\[(\d+)\]\][ \t]*", re.MULTILINE)
+
+
+class TokenBucket:
+    """Thread-safe token bucket, consume() blocks until a request may be sent."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.timestamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.timestamp) * self.rate
+            )
+            self.timestamp = now
+            # reserve the token now, so concurrent callers queue up behind us
+            wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0
+            self.tokens -= 1
+        if wait > 0:
+            time.sleep(wait)
+
+
+@lru_cache(maxsize=8)
+def _shared_openai_client(base_url: str, api_key: str) -> openai.OpenAI:
+    # 每个文件都会新建翻译器，共享 client 以复用连接池和已建立的 TLS 连接
+    return openai.OpenAI(base_url=base_url, api_key=api_key)
+
 
 def remove_control_characters(s):
     return "".join(ch for ch in s if unicodedata.category(ch)[0] != "C")
@@ -42,6 +102,7 @@ class BaseTranslator:
     envs = {}
     lang_map: dict[str, str] = {}
     CustomPrompt = False
+    batch_size = 1
 
     def __init__(self, lang_in: str, lang_out: str, model: str, ignore_cache: bool):
         lang_in = self.lang_map.get(lang_in.lower(), lang_in)
@@ -102,6 +163,23 @@ class BaseTranslator:
         self.cache.set(text, translation)
         return translation
 
+    def translate_many(self, texts: list[str], ignore_cache: bool = False) -> list[str]:
+        """
+        Translate several texts at once, cache hits are not sent to the service.
+        :param texts: texts to translate
+        :return: translated texts, in the same order
+        """
+        results = [None] * len(texts)
+        if not (self.ignore_cache or ignore_cache):
+            results = [self.cache.get(text) for text in texts]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            translations = self.do_translate_many([texts[i] for i in missing])
+            for i, translation in zip(missing, translations):
+                self.cache.set(texts[i], translation)
+                results[i] = translation
+        return results
+
     def do_translate(self, text: str) -> str:
         """
         Actual translate text, override this method
@@ -110,6 +188,14 @@ class BaseTranslator:
         """
         raise NotImplementedError
 
+    def do_translate_many(self, texts: list[str]) -> list[str]:
+        """
+        Actual translate a batch of texts, override this method to send them in fewer requests
+        :param texts: texts to translate
+        :return: translated texts
+        """
+        return [self.do_translate(text) for text in texts]
+
     def prompt(
         self, text: str, prompt_template: Template | None = None
     ) -> list[dict[str, str]]:
@@ -134,21 +220,27 @@ class BaseTranslator:
         return [
             {
                 "role": "user",
-                "content": (
-                    "You are a professional, authentic machine translation engine. "
-                    "Only Output the translated text, do not include any other text."
-                    "\n\n"
-                    f"Translate the following markdown source text to {self.lang_out}. "
-                    "Keep the formula notation {v*} unchanged. "
-                    "Output translation directly without any additional text."
-                    "\n\n"
-                    f"Source Text: {text}"
-                    "\n\n"
-                    "Translated Text:"
-                ),
+                "content": self._default_prompt_prefix(self.lang_out)
+                + text
+                + "\n\nTranslated Text:",
             },
         ]
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _default_prompt_prefix(lang_out: str) -> str:
+        # shared by every translator instance with the same target language
+        return (
+            "You are a professional, authentic machine translation engine. "
+            "Only Output the translated text, do not include any other text."
+            "\n\n"
+            f"Translate the following markdown source text to {lang_out}. "
+            "Keep the formula notation {v*} unchanged. "
+            "Output translation directly without any additional text."
+            "\n\n"
+            "Source Text: "
+        )
+
     def __str__(self):
         return f"{self.name} {self.lang_in} {self.lang_out} {self.model}"
 
@@ -421,9 +513,9 @@ class OpenAITranslator(BaseTranslator):
             model = self.envs["OPENAI_MODEL"]
         super().__init__(lang_in, lang_out, model, ignore_cache)
         self.options = {"temperature": 0}  # 随机采样可能会打断公式标记
-        self.client = openai.OpenAI(
-            base_url=base_url or self.envs["OPENAI_BASE_URL"],
-            api_key=api_key or self.envs["OPENAI_API_KEY"],
+        self.client = _shared_openai_client(
+            base_url or self.envs["OPENAI_BASE_URL"],
+            api_key or self.envs["OPENAI_API_KEY"],
         )
         self.prompttext = prompt
         self.add_cache_impact_parameters("temperature", self.options["temperature"])
@@ -431,28 +523,90 @@ class OpenAITranslator(BaseTranslator):
         think_filter_regex = r"^<think>.+?\n*(</think>|\n)*(</think>)\n*"
         self.add_cache_impact_parameters("think_filter_regex", think_filter_regex)
         self.think_filter_regex = re.compile(think_filter_regex, flags=re.DOTALL)
-
-    @retry(
-        retry=retry_if_exception_type(openai.RateLimitError),
-        stop=stop_after_attempt(100),
-        wait=wait_exponential(multiplier=1, min=1, max=15),
-        before_sleep=lambda retry_state: logger.warning(
-            f"RateLimitError, retrying in {retry_state.next_action.sleep} seconds... "
-            f"(Attempt {retry_state.attempt_number}/100)"
-        ),
-    )
+        # 主动限速，避免请求被服务端以 RateLimitError 拒绝后再重试
+        qps = float(ConfigManager.get("PDF2ZH_QPS") or 0)
+        self.bucket = TokenBucket(qps) if qps > 0 else None
+        # 多个段落合并到一次请求中翻译，自定义 prompt 或子类自定义了请求格式时不合并
+        batch_size = int(ConfigManager.get("PDF2ZH_BATCH_SIZE") or 1)
+        if (
+            batch_size > 1
+            and prompt is None
+            and type(self).do_translate is OpenAITranslator.do_translate
+        ):
+            self.batch_size = batch_size
+            self.add_cache_impact_parameters("batch_size", batch_size)
+
+    @OPENAI_RETRY
     def do_translate(self, text) -> str:
+        self._throttle()
         response = self.client.chat.completions.create(
             model=self.model,
             **self.options,
             messages=self.prompt(text, self.prompttext),
         )
-        if not response.choices:
+        return self._read_content(response)
+
+    def _throttle(self):
+        if self.bucket:
+            self.bucket.consume()
+
+    def do_translate_many(self, texts: list[str]) -> list[str]:
+        # 自定义 prompt 无法保证编号格式，逐段翻译
+        if len(texts) == 1 or self.prompttext is not None:
+            return super().do_translate_many(texts)
+        results = self._parse_batch(self.do_translate_batch(texts), len(texts))
+        if results is None:
+            logger.warning("Malformed batch translation, retrying segment by segment")
+            return super().do_translate_many(texts)
+        return results
+
+    @OPENAI_RETRY
+    def do_translate_batch(self, texts: list[str]) -> str:
+        content = self._batch_prompt_prefix(self.lang_out) + "\n\n".join(
+            f"[[{i}]] {text}" for i, text in enumerate(texts, 1)
+        )
+        self._throttle()
+        response = self.client.chat.completions.create(
+            model=self.model,
+            **self.options,
+            messages=[{"role": "user", "content": content}],
+        )
+        return self._read_content(response)
+
+    def _read_content(self, response) -> str:
+        choices = response.choices
+        if not choices:
             if hasattr(response, "error"):
                 raise ValueError("Error response from Service", response.error)
-        content = response.choices[0].message.content.strip()
-        content = self.think_filter_regex.sub("", content).strip()
-        return content
+        content = choices[0].message.content.strip()
+        return self.think_filter_regex.sub("", content).strip()
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _batch_prompt_prefix(lang_out: str) -> str:
+        return (
+            "You are a professional, authentic machine translation engine. "
+            f"Translate each of the following numbered markdown segments to {lang_out}. "
+            "Keep the formula notation {v*} unchanged. "
+            "Keep every [[n]] marker at the start of its line and output "
+            "exactly one translated segment per marker, without any additional text."
+            "\n\n"
+        )
+
+    @staticmethod
+    def _parse_batch(content: str, count: int) -> list[str] | None:
+        """
+        Split a numbered batch response back into segments
+        :return: translated segments, or None if the markers do not match
+                 or a segment is empty (e.g. merged into the previous one)
+        """
+        parts = BATCH_MARK_RE.split(content)
+        if parts[1::2] != [str(i) for i in range(1, count + 1)]:
+            return None
+        segments = [part.strip() for part in parts[2::2]]
+        if not all(segments):
+            return None
+        return segments
 
     def get_formular_placeholder(self, id: int):
         return "{{v" + str(id) + "}}"
@@ -540,6 +694,7 @@ class ModelScopeTranslator(OpenAITranslator):
             model,
             base_url=base_url,
             api_key=api_key,
+            prompt=prompt,
             ignore_cache=ignore_cache,
         )
         self.prompttext = prompt
@@ -569,12 +724,14 @@ class ZhipuTranslator(OpenAITranslator):
             model,
             base_url=base_url,
             api_key=api_key,
+            prompt=prompt,
             ignore_cache=ignore_cache,
         )
         self.prompttext = prompt
         self.add_cache_impact_parameters("prompt", self.prompt("", self.prompttext))
 
     def do_translate(self, text) -> str:
+        self._throttle()
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
@@ -614,6 +771,7 @@ class SiliconTranslator(OpenAITranslator):
             model,
             base_url=base_url,
             api_key=api_key,
+            prompt=prompt,
             ignore_cache=ignore_cache,
         )
         self.prompttext = prompt
@@ -643,6 +801,7 @@ class GeminiTranslator(OpenAITranslator):
             model,
             base_url=base_url,
             api_key=api_key,
+            prompt=prompt,
             ignore_cache=ignore_cache,
         )
         self.prompttext = prompt
@@ -872,6 +1031,7 @@ class GrokTranslator(OpenAITranslator):
             model,
             base_url=base_url,
             api_key=api_key,
+            prompt=prompt,
             ignore_cache=ignore_cache,
         )
         self.prompttext = prompt
@@ -899,6 +1059,7 @@ class GroqTranslator(OpenAITranslator):
             model,
             base_url=base_url,
             api_key=api_key,
+            prompt=prompt,
             ignore_cache=ignore_cache,
         )
         self.prompttext = prompt
@@ -926,6 +1087,7 @@ class DeepseekTranslator(OpenAITranslator):
             model,
             base_url=base_url,
             api_key=api_key,
+            prompt=prompt,
             ignore_cache=ignore_cache,
         )
         self.prompttext = prompt
@@ -963,6 +1125,7 @@ class OpenAIlikedTranslator(OpenAITranslator):
             model,
             base_url=base_url,
             api_key=api_key,
+            prompt=prompt,
             ignore_cache=ignore_cache,
         )
         self.prompttext = prompt
@@ -1035,6 +1198,7 @@ class QwenMtTranslator(OpenAITranslator):
             "target_lang": self.lang_mapping(self.lang_out),
             "domains": self.envs["ALI_DOMAINS"],
         }
+        self._throttle()
         response = self.client.chat.completions.create(
             model=self.model,
             **self.options,
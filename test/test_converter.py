@@ -95,6 +95,27 @@ class TestTranslateConverter(unittest.TestCase):
         result = self.converter.receive_layout(ltpage)
         self.assertIsNotNone(result)
 
+    def test_translate_paragraphs_in_batches(self):
+        class BatchTranslator:
+            batch_size = 3
+
+            def __init__(self):
+                self.batches = []
+
+            def translate_many(self, texts):
+                self.batches.append(texts)
+                return [text.upper() for text in texts]
+
+        translator = BatchTranslator()
+        self.converter.translator = translator
+        self.converter.thread = 2
+        sstk = ["a", " ", "b", "{v0}", "c", "d", "", "e", "f", "g"]
+        news = self.converter.translate_paragraphs(sstk)
+        self.assertEqual(news, ["A", " ", "B", "{v0}", "C", "D", "", "E", "F", "G"])
+        self.assertEqual(
+            sorted(translator.batches), [["a", "b", "c"], ["d", "e", "f"], ["g"]]
+        )
+
     def test_invalid_translation_service(self):
         with self.assertRaises(ValueError):
             TranslateConverter(
@@ -105,6 +126,17 @@ class TestTranslateConverter(unittest.TestCase):
                 service="InvalidService",
             )
 
+    def test_invalid_formula_regex(self):
+        with self.assertRaises(ValueError):
+            TranslateConverter(
+                self.rsrcmgr,
+                vfont="(",
+                layout=self.layout,
+                lang_in="en",
+                lang_out="zh",
+                service="google",
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from pdf2zh.pages import parse_pages
+
+
+class TestParsePages(unittest.TestCase):
+    def test_valid(self):
+        cases = [
+            ("7", (6,)),
+            ("1,2,3", (0, 1, 2)),
+            ("1-3", (0, 1, 2)),
+            ("1-3,5", (0, 1, 2, 4)),
+            ("2,4-5,9", (1, 3, 4, 8)),
+            (" 1 - 3 , 5 ", (0, 1, 2, 4)),
+            ("1, 2", (0, 1)),
+        ]
+        for pages, expected in cases:
+            with self.subTest(pages=pages):
+                self.assertEqual(parse_pages(pages), expected)
+
+    def test_invalid(self):
+        for pages in ["1-", "-3", "1,,2", "", "a", "1-2-3", "1.5"]:
+            with self.subTest(pages=pages):
+                with self.assertRaises(ValueError):
+                    parse_pages(pages)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pdf2zh.pdf2zh import find_all_files_in_directory
+
+
+class TestFindAllFilesInDirectory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        for path in [
+            "a.pdf",
+            "b.PDF",
+            "notes.txt",
+            "x/d.pdf",
+            "x/g.pdf",
+            "x/y/e.Pdf",
+            "z/f.pdf",
+        ]:
+            full_path = os.path.join(self.root, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            open(full_path, "w").close()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def walk_pdfs(self):
+        return [
+            os.path.join(root, file)
+            for root, _, files in os.walk(self.root)
+            for file in files
+            if file.lower().endswith(".pdf")
+        ]
+
+    def test_matches_os_walk_order(self):
+        result = find_all_files_in_directory(self.root)
+        self.assertEqual(result, self.walk_pdfs())
+        self.assertEqual(len(result), 6)
+
+    def test_skips_unreadable_directory(self):
+        denied = os.path.join(self.root, "x")
+        scandir = os.scandir
+
+        def fake_scandir(path):
+            if path == denied:
+                raise PermissionError(13, "denied")
+            return scandir(path)
+
+        with mock.patch("pdf2zh.pdf2zh.os.scandir", side_effect=fake_scandir):
+            result = find_all_files_in_directory(self.root)
+        self.assertEqual(
+            sorted(os.path.relpath(p, self.root) for p in result),
+            ["a.pdf", "b.PDF", os.path.join("z", "f.pdf")],
+        )
+
+    def test_not_a_directory(self):
+        with self.assertRaises(ValueError):
+            find_all_files_in_directory(os.path.join(self.root, "a.pdf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
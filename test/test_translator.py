@@ -1,12 +1,23 @@
 import unittest
+from string import Template
 from textwrap import dedent
 from unittest import mock
 
+import httpx
+import openai
+import tenacity
 from ollama import ResponseError as OllamaResponseError
 
 from pdf2zh import cache
 from pdf2zh.config import ConfigManager
-from pdf2zh.translator import BaseTranslator, OllamaTranslator, OpenAIlikedTranslator
+from pdf2zh.translator import (
+    BaseTranslator,
+    DeepseekTranslator,
+    OllamaTranslator,
+    OpenAIlikedTranslator,
+    OpenAITranslator,
+    TokenBucket,
+)
 
 # Since it is necessary to test whether the functionality meets the expected requirements,
 # private functions and private methods are allowed to be called.
@@ -77,6 +88,38 @@ class TestTranslator(unittest.TestCase):
         another_result = translator.translate(text)
         self.assertNotEqual(second_result, another_result)
 
+    def test_default_prompt(self):
+        translator = BaseTranslator("en", "zh", "test", False)
+        self.assertEqual(
+            translator.prompt("Hello World"),
+            [
+                {
+                    "role": "user",
+                    "content": (
+                        "You are a professional, authentic machine translation engine. "
+                        "Only Output the translated text, do not include any other text."
+                        "\n\n"
+                        "Translate the following markdown source text to zh. "
+                        "Keep the formula notation {v*} unchanged. "
+                        "Output translation directly without any additional text."
+                        "\n\n"
+                        "Source Text: Hello World"
+                        "\n\n"
+                        "Translated Text:"
+                    ),
+                }
+            ],
+        )
+
+    def test_translate_many(self):
+        translator = AutoIncreaseTranslator("en", "zh", "test", False)
+        cached = translator.translate("Hello")
+        results = translator.translate_many(["Hello", "World", "Hello"])
+        self.assertEqual(results, [cached, "2", cached])
+        self.assertEqual(translator.n, 2)
+        # batch translations are cached per text
+        self.assertEqual(translator.translate("World"), results[1])
+
     def test_base_translator_throw(self):
         translator = BaseTranslator("en", "zh", "test", False)
         with self.assertRaises(NotImplementedError):
@@ -152,6 +195,115 @@ class TestOpenAIlikedTranslator(unittest.TestCase):
         self.assertIsNone(translator.envs["OPENAILIKED_API_KEY"])
 
 
+class TestTokenBucket(unittest.TestCase):
+    def test_consume_blocks_when_empty(self):
+        bucket = TokenBucket(rate=1)
+        with mock.patch("pdf2zh.translator.time.sleep") as mock_sleep:
+            bucket.consume()
+            mock_sleep.assert_not_called()
+            bucket.consume()
+            mock_sleep.assert_called_once()
+            self.assertAlmostEqual(mock_sleep.call_args[0][0], 1, places=1)
+
+
+class TestOpenAITranslatorRetry(unittest.TestCase):
+    def setUp(self):
+        ConfigManager.clear()
+        self.translator = OpenAITranslator(
+            lang_in="en", lang_out="zh", model="test_model", api_key="test"
+        )
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        self.rate_limit = openai.RateLimitError(
+            "rate limited", response=httpx.Response(429, request=request), body=None
+        )
+        reply = mock.MagicMock()
+        reply.choices[0].message.content = "你好"
+        self.reply = reply
+
+    def test_retry_without_qps_keeps_long_budget(self):
+        self.assertIsNone(self.translator.bucket)
+        patch_client = mock.patch.object(self.translator, "client")
+        with mock.patch("time.sleep"), patch_client as mock_client:
+            create = mock_client.chat.completions.create
+            create.side_effect = [self.rate_limit] * 10 + [self.reply]
+            self.assertEqual(self.translator.do_translate("Hello"), "你好")
+        self.assertEqual(create.call_count, 11)
+
+    def test_retry_with_qps_is_a_short_safety_net(self):
+        self.translator.bucket = TokenBucket(rate=1000)
+        patch_client = mock.patch.object(self.translator, "client")
+        with mock.patch("time.sleep"), patch_client as mock_client:
+            create = mock_client.chat.completions.create
+            create.side_effect = [self.rate_limit] * 10 + [self.reply]
+            with self.assertRaises(tenacity.RetryError):
+                self.translator.do_translate("Hello")
+        self.assertEqual(create.call_count, 5)
+
+
+class TestOpenAITranslatorBatch(unittest.TestCase):
+    def test_parse_batch(self):
+        content = "[[1]] 你好\n\n[[2]] 世界 {v0}\n"
+        self.assertEqual(
+            OpenAITranslator._parse_batch(content, 2), ["你好", "世界 {v0}"]
+        )
+
+    def test_custom_prompt_disables_batching(self):
+        ConfigManager.clear()
+        ConfigManager.set("PDF2ZH_BATCH_SIZE", "4")
+        try:
+            batched = OpenAITranslator(
+                lang_in="en", lang_out="zh", model="test_model", api_key="test"
+            )
+            custom = OpenAITranslator(
+                lang_in="en",
+                lang_out="zh",
+                model="test_model",
+                api_key="test",
+                prompt=Template("$text"),
+            )
+            subclass_custom = DeepseekTranslator(
+                lang_in="en",
+                lang_out="zh",
+                model=None,
+                envs={"DEEPSEEK_API_KEY": "test"},
+                prompt=Template("$text"),
+            )
+        finally:
+            ConfigManager.delete("PDF2ZH_BATCH_SIZE")
+        self.assertEqual(batched.batch_size, 4)
+        self.assertIn("batch_size", batched.cache.params)
+        for translator in (custom, subclass_custom):
+            self.assertEqual(translator.batch_size, 1)
+            self.assertNotIn("batch_size", translator.cache.params)
+
+    def test_do_translate_many_falls_back_on_malformed_reply(self):
+        ConfigManager.clear()
+        translator = OpenAITranslator(
+            lang_in="en", lang_out="zh", model="test_model", api_key="test_api_key"
+        )
+
+        def reply(content):
+            response = mock.MagicMock()
+            response.choices[0].message.content = content
+            return response
+
+        with mock.patch.object(translator, "client") as mock_client:
+            mock_client.chat.completions.create.side_effect = [
+                reply("[[1]] 你好 世界"),
+                reply("你好"),
+                reply("世界"),
+            ]
+            results = translator.do_translate_many(["Hello", "World"])
+        self.assertEqual(results, ["你好", "世界"])
+        self.assertEqual(mock_client.chat.completions.create.call_count, 3)
+
+    def test_parse_batch_malformed(self):
+        self.assertIsNone(OpenAITranslator._parse_batch("[[1]] 你好", 2))
+        self.assertIsNone(OpenAITranslator._parse_batch("[[2]] 你好\n[[1]] 世界", 2))
+        self.assertIsNone(OpenAITranslator._parse_batch("[[1]] 你好 世界\n[[2]]", 2))
+        self.assertIsNone(OpenAITranslator._parse_batch("[[1]] 你好\n[[2]]  \n", 2))
+
+
 class TestOllamaTranslator(unittest.TestCase):
     def test_do_translate(self):
         translator = OllamaTranslator(lang_in="en", lang_out="zh", model="test:3b")